@@ -7,17 +7,24 @@ for reading resources (including any scripts) and executing them if needed.
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import mimetypes
+import os
 import re
 import sys
 import textwrap
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import (
     Any,
     Awaitable,
+    BinaryIO,
     Callable,
     Dict,
     Iterable,
@@ -37,11 +44,126 @@ from ._version import __version__
 
 
 LOGGER = logging.getLogger("skillz")
-FRONT_MATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)", re.DOTALL)
 SKILL_MARKDOWN = "SKILL.md"
 DEFAULT_SKILLS_ROOT = Path("~/.skillz")
 SERVER_NAME = "Skillz MCP Server"
 SERVER_VERSION = __version__
+MAX_BATCH_FETCH_BYTES = 8 * 1024 * 1024
+_BINARY_PROBE_BYTES = 1024
+STREAM_THRESHOLD_BYTES = 256 * 1024
+# A multiple of 3 so each chunk base64-encodes without padding.
+_STREAM_CHUNK_BYTES = 3 * 64 * 1024
+LOAD_MAX_WORKERS = 16
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_URI_PREFIX = "resource://skillz/"
+# Characters urllib.parse.quote never escapes; such segments pass as-is.
+_URI_SAFE_PART = re.compile(r"[A-Za-z0-9_.~-]+")
+# A ".." path segment, with either separator style.
+_TRAVERSAL_PATTERN = re.compile(r"(?:^|[/\\])\.\.(?:[/\\]|$)")
+# Usage guidance returned with every skill invocation.
+SKILL_USAGE_TEXT = textwrap.dedent(
+    """\
+    HOW TO USE THIS SKILL:
+
+    1. READ the instructions carefully - they contain
+       specialized guidance for completing the task.
+
+    2. UNDERSTAND the context:
+       - The 'task' field contains the specific request
+       - The 'metadata.allowed_tools' list specifies which
+         tools to use when applying this skill (if specified,
+         respect these constraints)
+       - The 'resources' array lists additional files
+
+    3. APPLY the skill instructions to complete the task:
+       - Follow the instructions as your primary guidance
+       - Use judgment to adapt instructions to the task
+       - Instructions are authored by skill creators and may
+         contain domain-specific expertise, best practices,
+         or specialized techniques
+
+    4. ACCESS resources when needed:
+       - If instructions reference additional files or you
+         need them, retrieve from the MCP server
+       - PREFERRED: Use native MCP resource fetching if your
+         client supports it (use URIs from 'resources' field)
+       - FALLBACK: If your client lacks MCP resource support,
+         call the fetch_resource tool with the URI. Example:
+         fetch_resource(resource_uri="resource://skillz/...")
+
+    5. RESPECT constraints:
+       - If 'metadata.allowed_tools' is specified and
+         non-empty, prefer using only those tools when
+         executing the skill instructions
+       - This helps ensure the skill works as intended
+
+    Remember: Skills are specialized instruction sets
+    created by experts. They provide domain knowledge and
+    best practices you can apply to user tasks.
+    """
+).strip()
+
+
+def _scandir_recursive(path: str) -> Iterator[os.DirEntry[str]]:
+    """Yield file entries below ``path`` using cached ``DirEntry`` data.
+
+    Symlinked directories are not followed and unreadable directories
+    are skipped, matching ``Path.rglob``.
+    """
+
+    try:
+        iterator = os.scandir(path)
+    except OSError:
+        return
+    with iterator as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+def _split_front_matter(text: str) -> Optional[tuple[str, str]]:
+    """Split SKILL.md text into its front matter and body.
+
+    A document must open with a ``---`` line and close the front matter
+    with another ``---`` line; whitespace around either delimiter is
+    allowed. The body is returned with leading whitespace stripped, so
+    every caller sees the same normalized text. Returns ``None`` when no
+    front matter block is present.
+    Uses ``str.find`` scans rather than a backtracking regular expression.
+    """
+
+    if not text.startswith("---"):
+        return None
+
+    # The front matter starts after a newline in the whitespace that
+    # follows the opening delimiter, preferring the last such newline.
+    length = len(text)
+    cursor = 3
+    starts: list[int] = []
+    while cursor < length and text[cursor].isspace():
+        cursor += 1
+        if text[cursor - 1] == "\n":
+            starts.append(cursor)
+
+    for start in reversed(starts):
+        search_from = start
+        while True:
+            closing = text.find("\n---", search_from)
+            if closing == -1:
+                break
+            cursor = closing + 4
+            body_start = -1
+            while cursor < length and text[cursor].isspace():
+                cursor += 1
+                if text[cursor - 1] == "\n":
+                    body_start = cursor
+            if body_start != -1:
+                return text[start:closing], text[body_start:].lstrip()
+            search_from = closing + 1
+    return None
 
 
 class SkillError(Exception):
@@ -81,7 +203,27 @@ class Skill:
     resources: tuple[Path, ...]
     zip_path: Optional[Path] = None
     zip_root_prefix: str = ""
+    body: Optional[str] = field(default=None, repr=False)
+    body_mtime_ns: Optional[int] = field(default=None, repr=False)
     _zip_members: Optional[set[str]] = field(default=None, init=False)
+    _zip_resource_paths: tuple[str, ...] = field(
+        default=(), init=False, repr=False
+    )
+    _resource_index: Optional[dict[str, Path]] = field(
+        default=None, init=False, repr=False
+    )
+    _resource_uris: Optional[tuple[str, ...]] = field(
+        default=None, init=False, repr=False
+    )
+    _zip_handle: Optional[zipfile.ZipFile] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _zip_handle_mtime_ns: int = field(
+        default=0, init=False, repr=False, compare=False
+    )
+    _zip_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Cache zip members for efficient lookups."""
@@ -104,21 +246,77 @@ class Skill:
                 else:
                     self._zip_members = all_members
 
+            # Resource listing is fixed for the archive; filter SKILL.md
+            # and macOS metadata once instead of on every iteration
+            self._zip_resource_paths = tuple(
+                name
+                for name in sorted(self._zip_members)
+                if name != SKILL_MARKDOWN
+                and "__MACOSX/" not in name
+                and not name.endswith(".DS_Store")
+            )
+
     @property
     def is_zip(self) -> bool:
         """Check if this skill is backed by a zip file."""
         return self.zip_path is not None
 
     def open_bytes(self, rel_path: str) -> bytes:
-        """Read file content as bytes."""
+        """Read file content as bytes.
+
+        Zip-backed skills keep one archive handle open across reads so
+        the central directory is parsed once rather than per resource;
+        the handle is reopened if the archive changes on disk.
+        """
         if self.is_zip:
-            with zipfile.ZipFile(self.zip_path) as z:
-                # Add the root prefix if present
-                zip_member_path = self.zip_root_prefix + rel_path
-                return z.read(zip_member_path)
+            # Add the root prefix if present
+            zip_member_path = self.zip_root_prefix + rel_path
+            with self._zip_lock:
+                return self._archive().read(zip_member_path)
         else:
             return (self.directory / rel_path).read_bytes()
 
+    def resource_size(self, rel_path: str) -> int:
+        """Return the uncompressed size of a file in this skill."""
+        if self.is_zip:
+            zip_member_path = self.zip_root_prefix + rel_path
+            with self._zip_lock:
+                return self._archive().getinfo(zip_member_path).file_size
+        return (self.directory / rel_path).stat().st_size
+
+    @contextmanager
+    def open_stream(self, rel_path: str) -> Iterator[BinaryIO]:
+        """Open a file in this skill for incremental binary reads.
+
+        Zip members are streamed through a dedicated archive handle so a
+        long read never holds the pooled handle's lock.
+        """
+        if self.is_zip:
+            zip_member_path = self.zip_root_prefix + rel_path
+            with zipfile.ZipFile(self.zip_path) as archive:
+                with archive.open(zip_member_path) as stream:
+                    yield stream
+        else:
+            with (self.directory / rel_path).open("rb") as stream:
+                yield stream
+
+    def _archive(self) -> zipfile.ZipFile:
+        """Return the pooled archive handle; caller holds ``_zip_lock``."""
+        mtime_ns = self.zip_path.stat().st_mtime_ns
+        if self._zip_handle is None or mtime_ns != self._zip_handle_mtime_ns:
+            if self._zip_handle is not None:
+                self._zip_handle.close()
+            self._zip_handle = zipfile.ZipFile(self.zip_path)
+            self._zip_handle_mtime_ns = mtime_ns
+        return self._zip_handle
+
+    def close(self) -> None:
+        """Release the pooled zip archive handle, if one is open."""
+        with self._zip_lock:
+            if self._zip_handle is not None:
+                self._zip_handle.close()
+                self._zip_handle = None
+
     def exists(self, rel_path: str) -> bool:
         """Check if a relative path exists in this skill."""
         if self.is_zip:
@@ -126,31 +324,57 @@ class Skill:
         else:
             return (self.directory / rel_path).exists()
 
+    def _index_resources(self) -> dict[str, Path]:
+        """Map POSIX relative paths to directory resources, once."""
+        if self._resource_index is None:
+            index: dict[str, Path] = {}
+            for resource in self.resources:
+                try:
+                    relative = resource.relative_to(self.directory)
+                except ValueError:  # pragma: no cover - defensive
+                    continue
+                index[relative.as_posix()] = resource
+            self._resource_index = index
+        return self._resource_index
+
+    def resource_path(self, rel_path: str) -> Optional[Path]:
+        """Return the file backing a directory resource, if registered.
+
+        Lookups use an index keyed by POSIX relative path that is built
+        on first use, so repeated fetches avoid scanning ``resources``.
+        """
+        return self._index_resources().get(Path(rel_path).as_posix())
+
+    @property
+    def resource_uris(self) -> tuple[str, ...]:
+        """Resource URIs in ``iter_resource_paths()`` order, built once."""
+        if self._resource_uris is None:
+            self._resource_uris = tuple(
+                _build_resource_uri(self.slug, rel_path)
+                for rel_path in self.iter_resource_paths()
+            )
+        return self._resource_uris
+
     def iter_resource_paths(self) -> Iterator[str]:
         """Iterate over resource file paths (excluding SKILL.md)."""
         if self.is_zip:
-            # Yield file paths from zip, skip SKILL.md and macOS metadata
-            for name in sorted(self._zip_members or []):
-                if name == SKILL_MARKDOWN:
-                    continue
-                if "__MACOSX/" in name or name.endswith(".DS_Store"):
-                    continue
-                yield name
+            # File paths from zip, without SKILL.md and macOS metadata
+            yield from self._zip_resource_paths
         else:
-            # Walk directory tree
-            for file_path in sorted(self.directory.rglob("*")):
-                if not file_path.is_file():
-                    continue
-                if file_path == self.instructions_path:
-                    continue
-                try:
-                    rel_path = file_path.relative_to(self.directory)
-                    yield rel_path.as_posix()
-                except ValueError:
-                    continue
+            # Resources were collected at load time; reuse their
+            # relative forms instead of walking the directory again
+            yield from self._index_resources()
 
     def read_body(self) -> str:
-        """Return the Markdown body of the skill."""
+        """Return the Markdown body of the skill.
+
+        The body parsed at load time is reused until the file backing
+        the skill (SKILL.md or the zip archive) changes on disk.
+        """
+
+        mtime_ns = self.instructions_path.stat().st_mtime_ns
+        if self.body is not None and mtime_ns == self.body_mtime_ns:
+            return self.body
 
         LOGGER.debug("Reading body for skill %s", self.slug)
         if self.is_zip:
@@ -158,9 +382,11 @@ class Skill:
             text = data.decode("utf-8")
         else:
             text = self.instructions_path.read_text(encoding="utf-8")
-        match = FRONT_MATTER_PATTERN.match(text)
-        if match:
-            return match.group(2).lstrip()
+        parts = _split_front_matter(text)
+        if parts is not None:
+            self.body = parts[1]
+            self.body_mtime_ns = mtime_ns
+            return self.body
         raise SkillValidationError(
             f"Skill {self.slug} is missing YAML front matter "
             "and cannot be served."
@@ -192,15 +418,15 @@ def parse_skill_md(path: Path) -> tuple[SkillMetadata, str]:
     """Parse SKILL.md front matter and body."""
 
     raw = path.read_text(encoding="utf-8")
-    match = FRONT_MATTER_PATTERN.match(raw)
-    if not match:
+    parts = _split_front_matter(raw)
+    if parts is None:
         raise SkillValidationError(
             f"{path} must begin with YAML front matter delimited by '---'."
         )
 
-    front_matter, body = match.groups()
+    front_matter, body = parts
     try:
-        data = yaml.safe_load(front_matter) or {}
+        data = yaml.load(front_matter, Loader=_YAML_LOADER) or {}
     except yaml.YAMLError as exc:  # pragma: no cover - defensive
         raise SkillValidationError(
             f"Unable to parse YAML in {path}: {exc}"
@@ -257,7 +483,7 @@ def parse_skill_md(path: Path) -> tuple[SkillMetadata, str]:
         allowed_tools=allowed_list,
         extra=extra,
     )
-    return metadata, body.lstrip()
+    return metadata, body
 
 
 class SkillRegistry:
@@ -273,76 +499,148 @@ class SkillRegistry:
         return tuple(self._skills_by_slug.values())
 
     def load(self) -> None:
-        if not self.root.exists() or not self.root.is_dir():
+        if not self.root.is_dir():
             raise SkillError(
                 f"Skills root {self.root} does not exist "
                 "or is not a directory."
             )
 
         LOGGER.info("Discovering skills in %s", self.root)
+        self.close()
         self._skills_by_slug.clear()
         self._skills_by_name.clear()
 
+        # Discovery order decides precedence, so the tree is walked
+        # sequentially; the I/O-bound loading of each candidate (parsing
+        # SKILL.md, walking resources, reading zip directories) runs in a
+        # thread pool and results are registered back in discovery order.
         root = self.root.resolve()
-        self._scan_directory(root)
+        candidates: list[Callable[[], Optional[Skill]]] = []
+        self._scan_directory(str(root), candidates)
+
+        if len(candidates) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(LOAD_MAX_WORKERS, len(candidates)),
+                thread_name_prefix="skillz-load",
+            ) as executor:
+                futures = [executor.submit(load) for load in candidates]
+                loaded = [future.result() for future in futures]
+        else:
+            loaded = [candidate() for candidate in candidates]
+
+        for skill in loaded:
+            if skill is not None:
+                self._register(skill)
 
         LOGGER.info("Loaded %d skills", len(self._skills_by_slug))
 
-    def _scan_directory(self, directory: Path) -> None:
+    def _scan_directory(
+        self,
+        directory: str,
+        candidates: list[Callable[[], Optional[Skill]]],
+    ) -> None:
         """Recursively scan directory for skills (both dirs and zips)."""
-        # If this directory has SKILL.md, treat it as a dir-based skill
-        skill_md_path = directory / SKILL_MARKDOWN
-        if skill_md_path.is_file():
-            self._register_dir_skill(directory, skill_md_path)
-            return  # Don't recurse into skill directories
-
-        # Otherwise, look for zip files and subdirectories
+        # A single listing serves both skill detection and, for skill
+        # directories, the top level of the resource walk. Paths stay
+        # plain strings until a skill is actually loaded.
         try:
-            entries = list(directory.iterdir())
-        except (OSError, PermissionError) as exc:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except OSError as exc:
             LOGGER.warning("Cannot read directory %s: %s", directory, exc)
             return
 
+        # If this directory has SKILL.md, treat it as a dir-based skill
+        for entry in entries:
+            if entry.name == SKILL_MARKDOWN and entry.is_file():
+                candidates.append(
+                    partial(
+                        self._load_dir_skill, Path(directory), entry, entries
+                    )
+                )
+                return  # Don't recurse into skill directories
+
         # First, recurse into subdirectories (to find directory skills first)
         # This ensures directory skills take precedence over zip skills
-        for entry in sorted(entries):
+        for entry in entries:
             if entry.is_dir():
-                self._scan_directory(entry)
+                self._scan_directory(entry.path, candidates)
 
         # Then check for zip files in this directory
-        for entry in sorted(entries):
-            if entry.is_file() and entry.suffix.lower() in (".zip", ".skill"):
-                self._try_register_zip_skill(entry)
+        for entry in entries:
+            suffix = os.path.splitext(entry.name)[1].lower()
+            if suffix in (".zip", ".skill") and entry.is_file():
+                candidates.append(
+                    partial(self._load_zip_skill, Path(entry.path))
+                )
 
-    def _register_dir_skill(self, directory: Path, skill_md: Path) -> None:
-        """Register a directory-based skill."""
-        try:
-            metadata, _ = parse_skill_md(skill_md)
-        except SkillValidationError as exc:
-            LOGGER.warning(
-                "Skipping invalid skill at %s: %s", directory, exc
-            )
-            return
+    def _register(self, skill: Skill) -> None:
+        """Register a loaded skill unless its slug or name is taken."""
+        slug = skill.slug
+        name = skill.metadata.name
+        if skill.is_zip:
+            if slug in self._skills_by_slug:
+                LOGGER.warning(
+                    "Duplicate skill slug '%s'; skipping zip %s",
+                    slug,
+                    skill.zip_path,
+                )
+                return
 
-        slug = slugify(metadata.name)
-        if slug in self._skills_by_slug:
-            LOGGER.error(
-                "Duplicate skill slug '%s'; skipping %s",
+            if name in self._skills_by_name:
+                LOGGER.warning(
+                    "Duplicate skill name '%s' found in zip %s; skipping",
+                    name,
+                    skill.zip_path,
+                )
+                return
+        else:
+            if slug in self._skills_by_slug:
+                LOGGER.error(
+                    "Duplicate skill slug '%s'; skipping %s",
+                    slug,
+                    skill.directory,
+                )
+                return
+
+            if name in self._skills_by_name:
+                LOGGER.warning(
+                    "Duplicate skill name '%s' found in %s; "
+                    "only first occurrence is kept",
+                    name,
+                    skill.directory,
+                )
+                return
+
+        self._skills_by_slug[slug] = skill
+        self._skills_by_name[name] = skill
+        if skill.is_zip:
+            LOGGER.debug(
+                "Registered zip-based skill '%s' from %s (root_prefix='%s')",
                 slug,
-                directory,
+                skill.zip_path,
+                skill.zip_root_prefix,
             )
-            return
 
-        if metadata.name in self._skills_by_name:
+    def _load_dir_skill(
+        self,
+        directory: Path,
+        skill_md_entry: os.DirEntry[str],
+        entries: list[os.DirEntry[str]],
+    ) -> Optional[Skill]:
+        """Load a directory-based skill, or return None if invalid."""
+        skill_md = Path(skill_md_entry.path)
+        try:
+            mtime_ns = skill_md_entry.stat().st_mtime_ns
+            metadata, body = parse_skill_md(skill_md)
+        except SkillValidationError as exc:
             LOGGER.warning(
-                "Duplicate skill name '%s' found in %s; "
-                "only first occurrence is kept",
-                metadata.name,
-                directory,
+                "Skipping invalid skill at %s: %s", directory, exc
             )
-            return
+            return None
 
-        resources = self._collect_resources(directory)
+        slug = slugify(metadata.name)
+        resources = self._collect_resources(directory, entries)
 
         skill = Skill(
             slug=slug,
@@ -350,6 +648,8 @@ class SkillRegistry:
             instructions_path=skill_md.resolve(),
             metadata=metadata,
             resources=resources,
+            body=body,
+            body_mtime_ns=mtime_ns,
         )
 
         if directory.name != slug:
@@ -359,12 +659,12 @@ class SkillRegistry:
                 slug,
             )
 
-        self._skills_by_slug[slug] = skill
-        self._skills_by_name[metadata.name] = skill
+        return skill
 
-    def _try_register_zip_skill(self, zip_path: Path) -> None:
-        """Try to register a zip file as a skill."""
+    def _load_zip_skill(self, zip_path: Path) -> Optional[Skill]:
+        """Load a zip file as a skill, or return None if it is not one."""
         try:
+            mtime_ns = zip_path.stat().st_mtime_ns
             with zipfile.ZipFile(zip_path) as z:
                 # Check if SKILL.md exists at root or in single top-level dir
                 members = {
@@ -400,7 +700,7 @@ class SkillRegistry:
                         "single top-level directory; skipping",
                         zip_path,
                     )
-                    return
+                    return None
 
                 # Parse SKILL.md from zip
                 skill_md_data = z.read(skill_md_path)
@@ -408,33 +708,33 @@ class SkillRegistry:
 
         except zipfile.BadZipFile:
             LOGGER.warning("Invalid or corrupt zip file: %s", zip_path)
-            return
+            return None
         except (OSError, UnicodeDecodeError) as exc:
             LOGGER.warning("Cannot read zip file %s: %s", zip_path, exc)
-            return
+            return None
 
         # Parse metadata
-        match = FRONT_MATTER_PATTERN.match(skill_md_text)
-        if not match:
+        parts = _split_front_matter(skill_md_text)
+        if parts is None:
             LOGGER.warning(
                 "Zip %s SKILL.md missing front matter; skipping", zip_path
             )
-            return
+            return None
 
-        front_matter, body = match.groups()
+        front_matter, body = parts
         try:
-            data = yaml.safe_load(front_matter) or {}
+            data = yaml.load(front_matter, Loader=_YAML_LOADER) or {}
         except yaml.YAMLError as exc:
             LOGGER.warning(
                 "Cannot parse YAML in %s SKILL.md: %s", zip_path, exc
             )
-            return
+            return None
 
         if not isinstance(data, Mapping):
             LOGGER.warning(
                 "Front matter in %s SKILL.md must be mapping", zip_path
             )
-            return
+            return None
 
         name = str(data.get("name", "")).strip()
         description = str(data.get("description", "")).strip()
@@ -442,7 +742,7 @@ class SkillRegistry:
             LOGGER.warning(
                 "Zip %s SKILL.md missing name or description", zip_path
             )
-            return
+            return None
 
         allowed = data.get("allowed-tools") or data.get("allowed_tools") or []
         if isinstance(allowed, str):
@@ -479,64 +779,49 @@ class SkillRegistry:
             extra=extra,
         )
 
-        # Use zip stem as slug
-        slug = slugify(metadata.name)
-        if slug in self._skills_by_slug:
-            LOGGER.warning(
-                "Duplicate skill slug '%s'; skipping zip %s",
-                slug,
-                zip_path,
-            )
-            return
-
-        if metadata.name in self._skills_by_name:
-            LOGGER.warning(
-                "Duplicate skill name '%s' found in zip %s; skipping",
-                metadata.name,
-                zip_path,
-            )
-            return
-
         # Create skill with zip_path set
-        skill = Skill(
-            slug=slug,
+        return Skill(
+            slug=slugify(metadata.name),
             directory=zip_path.parent.resolve(),
             instructions_path=zip_path.resolve(),
             metadata=metadata,
             resources=(),  # Will be populated from zip
             zip_path=zip_path.resolve(),
             zip_root_prefix=zip_root_prefix,
+            body=body,
+            body_mtime_ns=mtime_ns,
         )
 
-        self._skills_by_slug[slug] = skill
-        self._skills_by_name[metadata.name] = skill
-        LOGGER.debug(
-            "Registered zip-based skill '%s' from %s (root_prefix='%s')",
-            slug,
-            zip_path,
-            zip_root_prefix,
-        )
-
-    def _collect_resources(self, directory: Path) -> tuple[Path, ...]:
+    def _collect_resources(
+        self, directory: Path, entries: list[os.DirEntry[str]]
+    ) -> tuple[Path, ...]:
         """Collect all files in skill directory except SKILL.md.
 
         SKILL.md is only returned from the tool, not as a resource.
         All other files in the skill directory and subdirectories are
-        resources.
+        resources. ``entries`` is the top-level listing already taken
+        by ``_scan_directory``, so only subdirectories are walked again.
 
         Note: For zip-based skills, resources are collected via
         iter_resource_paths() directly from the Skill object.
         """
-        root = directory.resolve()
-        skill_md_path = root / SKILL_MARKDOWN
-        files = []
-        for file_path in sorted(root.rglob("*")):
-            if not file_path.is_file():
-                continue
-            if file_path == skill_md_path:
-                continue
-            files.append(file_path)
-        return tuple(files)
+        root_str = str(directory.resolve())
+        files: list[str] = []
+        for entry in entries:
+            path = os.path.join(root_str, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                files.extend(item.path for item in _scandir_recursive(path))
+            elif entry.is_file() and entry.name != SKILL_MARKDOWN:
+                files.append(path)
+        # Sort by path components so ordering matches sorted(Path, ...)
+        prefix_len = len(os.path.join(root_str, ""))
+        files.sort(key=lambda item: item[prefix_len:].split(os.sep))
+        return tuple(Path(item) for item in files)
+
+    def close(self) -> None:
+        """Release resources held by registered skills."""
+        for skill in self._skills_by_slug.values():
+            skill.close()
 
     def get(self, slug: str) -> Skill:
         try:
@@ -545,28 +830,35 @@ class SkillRegistry:
             raise SkillError(f"Unknown skill '{slug}'") from exc
 
 
-def _build_resource_uri(skill: Skill, relative_path: Path) -> str:
+def _quote_part(part: str) -> str:
+    """Percent-encode one URI path segment, skipping already-safe text."""
+    if _URI_SAFE_PART.fullmatch(part):
+        return part
+    return quote(part, safe="")
+
+
+def _build_resource_uri(slug: str, relative_path: str) -> str:
     """Build a resource URI following MCP specification.
 
     Format: [protocol]://[host]/[path]
     Example: resource://skillz/skill-name/path/to/file.ext
     """
-    encoded_slug = quote(skill.slug, safe="")
-    encoded_parts = [quote(part, safe="") for part in relative_path.parts]
+    encoded_slug = _quote_part(slug)
+    encoded_parts = [_quote_part(part) for part in relative_path.split("/")]
     path_suffix = "/".join(encoded_parts)
-    return f"resource://skillz/{encoded_slug}/{path_suffix}"
+    return f"{_URI_PREFIX}{encoded_slug}/{path_suffix}"
 
 
-def _get_resource_name(skill: Skill, relative_path: Path) -> str:
+def _get_resource_name(skill: Skill, relative_path: str) -> str:
     """Get resource name (path without protocol) following MCP specification.
 
     This is the URI path without the protocol prefix.
     Example: skillz/skill-name/path/to/file.ext
     """
-    return f"{skill.slug}/{relative_path.as_posix()}"
+    return f"{skill.slug}/{relative_path}"
 
 
-def _detect_mime_type(file_path: Path) -> Optional[str]:
+def _detect_mime_type(file_path: str | Path) -> Optional[str]:
     """Detect MIME type for a file, returning None if unknown.
 
     Uses Python's mimetypes library for detection.
@@ -575,6 +867,43 @@ def _detect_mime_type(file_path: Path) -> Optional[str]:
     return mime_type
 
 
+def _decode_text(data: bytes) -> Optional[str]:
+    """Return ``data`` as UTF-8 text, or ``None`` if it looks binary.
+
+    A NUL byte near the start marks the content as binary without
+    attempting a full decode and raising ``UnicodeDecodeError``.
+    """
+    if b"\x00" in data[:_BINARY_PROBE_BYTES]:
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def _read_streamed_content(stream: BinaryIO) -> tuple[str, str]:
+    """Read a large resource and return ``(content, encoding)``.
+
+    Binary data (detected from the first chunk) is base64-encoded one
+    chunk at a time, so the raw bytes are never held in full alongside
+    their encoding. Text is read whole and decoded as UTF-8, falling back
+    to base64 if it turns out not to be valid UTF-8.
+    """
+    head = stream.read(_STREAM_CHUNK_BYTES)
+    if b"\x00" not in head[:_BINARY_PROBE_BYTES]:
+        data = bytearray(head)
+        data += stream.read()
+        try:
+            return data.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            return base64.b64encode(data).decode("ascii"), "base64"
+
+    chunks = [base64.b64encode(head).decode("ascii")]
+    while chunk := stream.read(_STREAM_CHUNK_BYTES):
+        chunks.append(base64.b64encode(chunk).decode("ascii"))
+    return "".join(chunks), "base64"
+
+
 def _make_error_resource(resource_uri: str, message: str) -> Dict[str, Any]:
     """Create an error resource response.
 
@@ -583,13 +912,10 @@ def _make_error_resource(resource_uri: str, message: str) -> Dict[str, Any]:
     """
     # Try to extract a name from the URI
     name = "invalid resource"
-    if resource_uri.startswith("resource://skillz/"):
-        try:
-            path_part = resource_uri[len("resource://skillz/"):]
-            if path_part:
-                name = path_part
-        except Exception:  # pragma: no cover - defensive
-            pass
+    if resource_uri.startswith(_URI_PREFIX):
+        path_part = resource_uri[len(_URI_PREFIX):]
+        if path_part:
+            name = path_part
 
     return {
         "uri": resource_uri,
@@ -600,39 +926,36 @@ def _make_error_resource(resource_uri: str, message: str) -> Dict[str, Any]:
     }
 
 
-def _fetch_resource_json(
+def _resolve_resource_uri(
     registry: SkillRegistry, resource_uri: str
-) -> Dict[str, Any]:
-    """Fetch a resource by URI and return as JSON.
+) -> tuple[Skill, str] | Dict[str, Any]:
+    """Resolve a resource URI to its skill and relative path.
 
-    Returns a dict with fields: uri, name, mime_type, content, encoding.
-    On any error, returns an error resource (never raises).
+    Returns an error resource instead when the URI is malformed or does
+    not name a registered resource.
     """
     # Validate URI prefix
-    if not resource_uri.startswith("resource://skillz/"):
+    if not resource_uri.startswith(_URI_PREFIX):
         return _make_error_resource(
             resource_uri,
-            "unsupported URI prefix. Expected resource://skillz/{skill-slug}/{path}",
+            f"unsupported URI prefix. Expected {_URI_PREFIX}"
+            "{skill-slug}/{path}",
         )
 
     # Parse slug and path
-    remainder = resource_uri[len("resource://skillz/"):]
-    if not remainder:
-        return _make_error_resource(
-            resource_uri, "invalid resource URI format"
-        )
-
-    parts = remainder.split("/", 1)
-    if len(parts) != 2 or not parts[0] or not parts[1]:
+    slug, _, rel_path_str = resource_uri[len(_URI_PREFIX):].partition("/")
+    if not slug or not rel_path_str:
         return _make_error_resource(
             resource_uri, "invalid resource URI format"
         )
 
-    slug = unquote(parts[0])
-    rel_path_str = unquote(parts[1])
+    slug = unquote(slug)
+    rel_path_str = unquote(rel_path_str)
 
     # Validate path doesn't traverse upward
-    if ".." in rel_path_str or rel_path_str.startswith("/"):
+    if rel_path_str.startswith("/") or _TRAVERSAL_PATTERN.search(
+        rel_path_str
+    ):
         return _make_error_resource(
             resource_uri, "invalid path: path traversal not allowed"
         )
@@ -646,53 +969,59 @@ def _fetch_resource_json(
     # Check if resource exists
     if skill.is_zip:
         # For zip-based skills, check if resource exists
-        if not skill.exists(rel_path_str):
-            return _make_error_resource(
-                resource_uri, f"resource not found: {rel_path_str}"
-            )
+        found = skill.exists(rel_path_str)
     else:
-        # For directory-based skills, find in resources list
-        rel_path = Path(rel_path_str)
-        resource_file: Optional[Path] = None
+        # For directory-based skills, look up the registered resource
+        found = skill.resource_path(rel_path_str) is not None
+    if not found:
+        return _make_error_resource(
+            resource_uri, f"resource not found: {rel_path_str}"
+        )
 
-        for resource_path in skill.resources:
-            try:
-                resource_relative = resource_path.relative_to(
-                    skill.directory
-                )
-                if resource_relative == rel_path:
-                    resource_file = resource_path
-                    break
-            except ValueError:  # pragma: no cover - defensive
-                continue
+    return skill, rel_path_str
 
-        if resource_file is None:
-            return _make_error_resource(
-                resource_uri, f"resource not found: {rel_path_str}"
-            )
 
+def _read_resource_json(
+    skill: Skill,
+    rel_path_str: str,
+    resource_uri: str,
+    size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Read a resolved resource and return it as JSON.
+
+    ``size`` may carry the resource size when the caller already looked
+    it up. Read failures are returned as error resources.
+    """
     # Detect MIME type (from path string)
-    mime_type, _ = mimetypes.guess_type(rel_path_str)
+    mime_type = _detect_mime_type(rel_path_str)
 
-    # Read content
+    # Read content; large files are streamed so binary data can be
+    # base64-encoded chunk by chunk
     try:
-        if skill.is_zip:
-            data = skill.open_bytes(rel_path_str)
+        if size is None:
+            size = skill.resource_size(rel_path_str)
+        if size > STREAM_THRESHOLD_BYTES:
+            with skill.open_stream(rel_path_str) as stream:
+                content, encoding = _read_streamed_content(stream)
         else:
-            data = resource_file.read_bytes()
+            if skill.is_zip:
+                data = skill.open_bytes(rel_path_str)
+            else:
+                data = skill.resource_path(rel_path_str).read_bytes()
+
+            # Try to decode as UTF-8 text; if that fails, encode as base64
+            text = _decode_text(data)
+            if text is not None:
+                content = text
+                encoding = "utf-8"
+            else:
+                content = base64.b64encode(data).decode("ascii")
+                encoding = "base64"
     except (OSError, KeyError) as exc:
         return _make_error_resource(
             resource_uri, f"failed to read resource: {exc}"
         )
 
-    # Try to decode as UTF-8 text; if that fails, encode as base64
-    try:
-        content = data.decode("utf-8")
-        encoding = "utf-8"
-    except UnicodeDecodeError:
-        content = base64.b64encode(data).decode("ascii")
-        encoding = "base64"
-
     # Build resource name
     name = f"{skill.slug}/{rel_path_str}"
 
@@ -705,6 +1034,72 @@ def _fetch_resource_json(
     }
 
 
+def _fetch_resource_json(
+    registry: SkillRegistry, resource_uri: str
+) -> Dict[str, Any]:
+    """Fetch a resource by URI and return as JSON.
+
+    Returns a dict with fields: uri, name, mime_type, content, encoding.
+    On any error, returns an error resource (never raises).
+    """
+    resolved = _resolve_resource_uri(registry, resource_uri)
+    if isinstance(resolved, dict):
+        return resolved
+    skill, rel_path_str = resolved
+    return _read_resource_json(skill, rel_path_str, resource_uri)
+
+
+def _fetch_resources_json(
+    registry: SkillRegistry,
+    resource_uris: Iterable[str],
+    *,
+    max_bytes: int = MAX_BATCH_FETCH_BYTES,
+) -> list[Dict[str, Any]]:
+    """Fetch several resources by URI in a single call.
+
+    Each URI is resolved exactly like ``_fetch_resource_json``. Resource
+    sizes are checked before reading: a resource that would take the
+    batch past ``max_bytes`` of file data is not read and is returned
+    as an error resource, so clients can fetch it separately.
+    """
+    results: list[Dict[str, Any]] = []
+    remaining = max_bytes
+    for resource_uri in resource_uris:
+        if not resource_uri:
+            results.append(
+                _make_error_resource("(missing)", "resource_uri is required")
+            )
+            continue
+        resolved = _resolve_resource_uri(registry, resource_uri)
+        if isinstance(resolved, dict):
+            results.append(resolved)
+            continue
+        skill, rel_path_str = resolved
+        try:
+            size = skill.resource_size(rel_path_str)
+        except (OSError, KeyError) as exc:
+            results.append(
+                _make_error_resource(
+                    resource_uri, f"failed to read resource: {exc}"
+                )
+            )
+            continue
+        if size > remaining:
+            results.append(
+                _make_error_resource(
+                    resource_uri,
+                    "batch size limit exceeded; fetch this resource "
+                    "separately",
+                )
+            )
+            continue
+        remaining -= size
+        results.append(
+            _read_resource_json(skill, rel_path_str, resource_uri, size)
+        )
+    return results
+
+
 def register_skill_resources(
     mcp: FastMCP, skill: Skill
 ) -> tuple[SkillResourceMetadata, ...]:
@@ -723,13 +1118,11 @@ def register_skill_resources(
 
     if skill.is_zip:
         # For zip-based skills, iterate over resources from zip
-        for rel_path_str in skill.iter_resource_paths():
-            # Build URI and name
-            slug_encoded = quote(skill.slug, safe="")
-            path_encoded = quote(rel_path_str, safe="/")
-            uri = f"resource://skillz/{slug_encoded}/{path_encoded}"
-            name = f"{skill.slug}/{rel_path_str}"
-            mime_type, _ = mimetypes.guess_type(rel_path_str)
+        for rel_path_str, uri in zip(
+            skill.iter_resource_paths(), skill.resource_uris
+        ):
+            name = _get_resource_name(skill, rel_path_str)
+            mime_type = _detect_mime_type(rel_path_str)
 
             def _make_zip_resource_reader(
                 s: Skill, p: str
@@ -742,12 +1135,10 @@ def register_skill_resources(
                             f"Failed to read resource '{p}' from zip: {exc}"
                         ) from exc
 
-                    # Try to decode as UTF-8 text; if that fails, return binary
-                    try:
-                        return data.decode("utf-8")
-                    except UnicodeDecodeError:
-                        # FastMCP will handle base64 encoding for binary
-                        return data
+                    # Return UTF-8 text when possible; FastMCP will handle
+                    # base64 encoding for binary
+                    text = _decode_text(data)
+                    return data if text is None else text
 
                 return _read_resource
 
@@ -764,15 +1155,14 @@ def register_skill_resources(
             )
     else:
         # For directory-based skills, iterate over file paths
-        for resource_path in skill.resources:
-            try:
-                relative_path = resource_path.relative_to(skill.directory)
-            except ValueError:  # pragma: no cover - defensive safeguard
-                relative_path = Path(resource_path.name)
-
-            uri = _build_resource_uri(skill, relative_path)
-            name = _get_resource_name(skill, relative_path)
-            mime_type = _detect_mime_type(resource_path)
+        for rel_path_str, uri in zip(
+            skill.iter_resource_paths(), skill.resource_uris
+        ):
+            resource_path = skill.resource_path(rel_path_str)
+            if resource_path is None:  # pragma: no cover - defensive
+                continue
+            name = _get_resource_name(skill, rel_path_str)
+            mime_type = _detect_mime_type(rel_path_str)
 
             def _make_resource_reader(
                 path: Path,
@@ -785,12 +1175,10 @@ def register_skill_resources(
                             f"Failed to read resource '{path}': {exc}"
                         ) from exc
 
-                    # Try to decode as UTF-8 text; if that fails, return binary
-                    try:
-                        return data.decode("utf-8")
-                    except UnicodeDecodeError:
-                        # FastMCP will handle base64 encoding for binary data
-                        return data
+                    # Return UTF-8 text when possible; FastMCP will handle
+                    # base64 encoding for binary
+                    text = _decode_text(data)
+                    return data if text is None else text
 
                 return _read_resource
 
@@ -837,10 +1225,31 @@ def register_skill_tool(
     Clients are expected to read the instructions and retrieve any
     referenced resources from the MCP server as needed.
     """
-    tool_name = skill.slug
+    slug = skill.slug
+    tool_name = slug
     description = _format_tool_description(skill)
-    bound_skill = skill
-    bound_resources = resources
+    # Bind hot attributes once so invocations avoid repeated lookups.
+    read_body = skill.read_body
+    # Metadata and resource listings never change once a skill is
+    # registered, so build them once instead of on every invocation.
+    # Each response gets its own shallow copies so a caller mutating
+    # one response cannot alter later ones.
+    allowed_tools = tuple(skill.metadata.allowed_tools)
+    metadata_response: dict[str, Any] = {
+        "name": skill.metadata.name,
+        "description": skill.metadata.description,
+        "license": skill.metadata.license,
+        "allowed_tools": allowed_tools,
+        "extra": skill.metadata.extra,
+    }
+    resource_entries = tuple(
+        {
+            "uri": entry["uri"],
+            "name": entry["name"],
+            "mime_type": entry["mime_type"],
+        }
+        for entry in resources
+    )
 
     @mcp.tool(name=tool_name, description=description)
     async def _skill_tool(  # type: ignore[unused-ignore]
@@ -849,7 +1258,7 @@ def register_skill_tool(
     ) -> Mapping[str, Any]:
         LOGGER.info(
             "Skill %s tool invoked task=%s",
-            bound_skill.slug,
+            slug,
             task,
         )
 
@@ -859,76 +1268,25 @@ def register_skill_tool(
                     "The 'task' parameter must be a non-empty string."
                 )
 
-            instructions = bound_skill.read_body()
-            resource_entries = [
-                {
-                    "uri": entry["uri"],
-                    "name": entry["name"],
-                    "mime_type": entry["mime_type"],
-                }
-                for entry in bound_resources
-            ]
+            instructions = await asyncio.to_thread(read_body)
 
             response: dict[str, Any] = {
-                "skill": bound_skill.slug,
+                "skill": slug,
                 "task": task,
                 "metadata": {
-                    "name": bound_skill.metadata.name,
-                    "description": bound_skill.metadata.description,
-                    "license": bound_skill.metadata.license,
-                    "allowed_tools": list(bound_skill.metadata.allowed_tools),
-                    "extra": bound_skill.metadata.extra,
+                    **metadata_response,
+                    "allowed_tools": list(allowed_tools),
                 },
-                "resources": resource_entries,
+                "resources": [dict(entry) for entry in resource_entries],
                 "instructions": instructions,
-                "usage": textwrap.dedent(
-                    """\
-                    HOW TO USE THIS SKILL:
-
-                    1. READ the instructions carefully - they contain
-                       specialized guidance for completing the task.
-
-                    2. UNDERSTAND the context:
-                       - The 'task' field contains the specific request
-                       - The 'metadata.allowed_tools' list specifies which
-                         tools to use when applying this skill (if specified,
-                         respect these constraints)
-                       - The 'resources' array lists additional files
-
-                    3. APPLY the skill instructions to complete the task:
-                       - Follow the instructions as your primary guidance
-                       - Use judgment to adapt instructions to the task
-                       - Instructions are authored by skill creators and may
-                         contain domain-specific expertise, best practices,
-                         or specialized techniques
-
-                    4. ACCESS resources when needed:
-                       - If instructions reference additional files or you
-                         need them, retrieve from the MCP server
-                       - PREFERRED: Use native MCP resource fetching if your
-                         client supports it (use URIs from 'resources' field)
-                       - FALLBACK: If your client lacks MCP resource support,
-                         call the fetch_resource tool with the URI. Example:
-                         fetch_resource(resource_uri="resource://skillz/...")
-
-                    5. RESPECT constraints:
-                       - If 'metadata.allowed_tools' is specified and
-                         non-empty, prefer using only those tools when
-                         executing the skill instructions
-                       - This helps ensure the skill works as intended
-
-                    Remember: Skills are specialized instruction sets
-                    created by experts. They provide domain knowledge and
-                    best practices you can apply to user tasks.
-                    """
-                ).strip(),
+                "usage": SKILL_USAGE_TEXT,
             }
 
             return response
         except SkillError as exc:
             LOGGER.error(
                 "Skill %s invocation failed: %s",
-                bound_skill.slug,
+                slug,
                 exc,
                 exc_info=True,
             )
@@ -1091,7 +1449,9 @@ def build_server(registry: SkillRegistry) -> FastMCP:
             )
         else:
             try:
-                result = _fetch_resource_json(registry, resource_uri)
+                result = await asyncio.to_thread(
+                    _fetch_resource_json, registry, resource_uri
+                )
             except Exception as exc:  # pragma: no cover - defensive
                 LOGGER.error(
                     "Unexpected error fetching resource %s: %s",
@@ -1105,6 +1465,40 @@ def build_server(registry: SkillRegistry) -> FastMCP:
 
         return result
 
+    @mcp.tool(
+        name="fetch_resources",
+        description=(
+            "[FALLBACK ONLY] Fetch several skill resources by URI in one "
+            "call. Behaves like fetch_resource for each URI and returns "
+            "the results in the same order under 'resources'. Only use "
+            "this if your client does NOT support native MCP resource "
+            "fetching."
+        ),
+    )
+    async def fetch_resources(
+        resource_uris: list[str],
+        ctx: Optional[Context] = None,
+    ) -> Mapping[str, Any]:
+        """Fetch multiple resources by URI and return their contents."""
+        LOGGER.info(
+            "fetch_resources invoked for %d URIs", len(resource_uris)
+        )
+        try:
+            results = await asyncio.to_thread(
+                _fetch_resources_json, registry, resource_uris
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            LOGGER.error(
+                "Unexpected error fetching resources: %s",
+                exc,
+                exc_info=True,
+            )
+            results = [
+                _make_error_resource(uri, f"unexpected error: {exc}")
+                for uri in resource_uris
+            ]
+        return {"resources": results}
+
     for skill in registry.skills:
         resource_metadata = register_skill_resources(mcp, skill)
         register_skill_tool(
@@ -235,3 +235,130 @@ async def test_skill_usage_mentions_fetch_resource(tmp_path: Path) -> None:
     assert "usage" in result
     assert "fetch_resource" in result["usage"]
     assert "resource_uri" in result["usage"]
+
+
+@pytest.mark.asyncio
+async def test_skill_tool_responses_do_not_share_state(tmp_path: Path) -> None:
+    """Test mutating one skill tool response leaves later ones intact."""
+    write_skill_with_resources(tmp_path, name="TestSkill")
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    server = build_server(registry)
+    tools = await server.get_tools()
+    skill_tool = tools["testskill"]
+
+    first = await skill_tool.fn(task="first")
+    first["metadata"]["name"] = "changed"
+    first["metadata"]["allowed_tools"].append("extra")
+    first["resources"][0]["uri"] = "changed"
+    first["resources"].clear()
+
+    second = await skill_tool.fn(task="second")
+    assert second["metadata"]["name"] == "TestSkill"
+    assert second["metadata"]["allowed_tools"] == []
+    assert len(second["resources"]) == 3
+    assert all(entry["uri"] != "changed" for entry in second["resources"])
+
+
+@pytest.mark.asyncio
+async def test_fetch_resources_returns_results_in_order(
+    tmp_path: Path,
+) -> None:
+    """Test batch fetching returns one result per URI, in order."""
+    write_skill_with_resources(tmp_path, name="TestSkill")
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    server = build_server(registry)
+    tools = await server.get_tools()
+    assert "fetch_resources" in tools
+
+    result = await tools["fetch_resources"].fn(
+        resource_uris=[
+            "resource://skillz/testskill/script.py",
+            "resource://skillz/testskill/missing.txt",
+            "resource://skillz/testskill/data.bin",
+        ]
+    )
+
+    resources = result["resources"]
+    assert len(resources) == 3
+    assert resources[0]["content"] == "print('hello')"
+    assert "resource not found: missing.txt" in resources[1]["content"]
+    assert resources[2]["encoding"] == "base64"
+
+
+def test_fetch_resources_respects_byte_limit(tmp_path: Path) -> None:
+    """Test resources past the batch byte limit become errors."""
+    from skillz._server import _fetch_resources_json
+
+    skill_dir = write_skill_with_resources(tmp_path, name="TestSkill")
+    (skill_dir / "big.txt").write_text("x" * 100, encoding="utf-8")
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    results = _fetch_resources_json(
+        registry,
+        [
+            "resource://skillz/testskill/big.txt",
+            "resource://skillz/testskill/script.py",
+            "resource://skillz/testskill/README.md",
+            "resource://skillz/testskill/data.bin",
+        ],
+        max_bytes=20,
+    )
+
+    # Oversized resources are rejected from their size, before reading
+    assert "batch size limit exceeded" in results[0]["content"]
+    assert results[1]["content"] == "print('hello')"
+    # 14 bytes used; the 8-byte README no longer fits, the 6-byte blob does
+    assert "batch size limit exceeded" in results[2]["content"]
+    assert results[3]["encoding"] == "base64"
+
+
+@pytest.mark.asyncio
+async def test_fetch_nul_prefixed_resource_is_base64(tmp_path: Path) -> None:
+    """Test content with an early NUL byte is served as binary."""
+    skill_dir = write_skill_with_resources(tmp_path, name="TestSkill")
+    (skill_dir / "blob.dat").write_bytes(b"\x00ascii")
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    server = build_server(registry)
+    tools = await server.get_tools()
+
+    result = await tools["fetch_resource"].fn(
+        resource_uri="resource://skillz/testskill/blob.dat"
+    )
+
+    assert result["encoding"] == "base64"
+    assert base64.b64decode(result["content"]) == b"\x00ascii"
+
+
+@pytest.mark.asyncio
+async def test_fetch_resource_allows_dots_inside_names(tmp_path: Path) -> None:
+    """Test only '..' path segments count as traversal."""
+    skill_dir = write_skill_with_resources(tmp_path, name="TestSkill")
+    (skill_dir / "notes..txt").write_text("dots", encoding="utf-8")
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    server = build_server(registry)
+    tools = await server.get_tools()
+    fetch_tool = tools["fetch_resource"]
+
+    result = await fetch_tool.fn(
+        resource_uri="resource://skillz/testskill/notes..txt"
+    )
+    assert result["content"] == "dots"
+
+    result = await fetch_tool.fn(
+        resource_uri="resource://skillz/testskill/docs/../script.py"
+    )
+    assert "path traversal" in result["content"]
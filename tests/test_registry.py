@@ -1,5 +1,8 @@
+import os
 from pathlib import Path
 
+import pytest
+
 from skillz import SkillRegistry
 
 
@@ -28,3 +31,118 @@ def test_registry_discovers_skill(tmp_path: Path) -> None:
     skill = registry.get("echo")
     assert skill.metadata.name == "Echo"
     assert skill.instructions_path.name == "SKILL.md"
+
+
+def test_registry_collects_nested_resources_in_order(tmp_path: Path) -> None:
+    skill_dir = write_skill(tmp_path, name="Echo")
+    (skill_dir / "a-b").mkdir()
+    (skill_dir / "a-b" / "x.txt").write_text("x", encoding="utf-8")
+    (skill_dir / "a").mkdir()
+    (skill_dir / "a" / "y.txt").write_text("y", encoding="utf-8")
+    (skill_dir / "z.txt").write_text("z", encoding="utf-8")
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    skill = registry.get("echo")
+    relative = [
+        path.relative_to(skill.directory).as_posix()
+        for path in skill.resources
+    ]
+    assert relative == ["a/y.txt", "a-b/x.txt", "z.txt"]
+    assert list(skill.iter_resource_paths()) == relative
+
+
+def test_registry_skips_unreadable_resource_directories(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    skill_dir = write_skill(tmp_path, name="Echo")
+    (skill_dir / "ok.txt").write_text("ok", encoding="utf-8")
+    private = skill_dir / "private"
+    private.mkdir()
+    (private / "secret.txt").write_text("secret", encoding="utf-8")
+
+    real_scandir = os.scandir
+
+    def fake_scandir(path):
+        if Path(path).name == "private":
+            raise PermissionError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", fake_scandir)
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    skill = registry.get("echo")
+    assert list(skill.iter_resource_paths()) == ["ok.txt"]
+
+
+def test_read_body_reuses_parsed_body_until_file_changes(
+    tmp_path: Path,
+) -> None:
+    skill_dir = write_skill(tmp_path, name="Echo")
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    skill = registry.get("echo")
+    assert skill.body == "Body\n"
+    assert skill.read_body() == "Body\n"
+
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(
+        "---\nname: Echo\ndescription: Test skill\n---\nUpdated\n",
+        encoding="utf-8",
+    )
+    stat = skill_md.stat()
+    os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert skill.read_body() == "Updated\n"
+
+
+def test_cached_body_matches_reread_for_indented_body(
+    tmp_path: Path,
+) -> None:
+    skill_dir = tmp_path / "indented"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: Indented\ndescription: Test\n---\n    Body here\n",
+        encoding="utf-8",
+    )
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    skill = registry.get("indented")
+    assert skill.body == "Body here\n"
+    skill.body = None
+    assert skill.read_body() == "Body here\n"
+
+
+def test_registry_accepts_crlf_front_matter(tmp_path: Path) -> None:
+    skill_dir = tmp_path / "echo"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_bytes(
+        b"---\r\nname: Echo\r\ndescription: Test skill\r\n---\r\nBody\r\n"
+    )
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    skill = registry.get("echo")
+    assert skill.metadata.description == "Test skill"
+    assert skill.read_body() == "Body\n"
+
+
+def test_registry_loads_many_skills_in_discovery_order(
+    tmp_path: Path,
+) -> None:
+    names = [f"Skill{index:02d}" for index in range(20)]
+    for name in reversed(names):
+        write_skill(tmp_path, name=name)
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    assert [skill.metadata.name for skill in registry.skills] == names
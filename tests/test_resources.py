@@ -131,3 +131,21 @@ def test_resource_uris_use_resource_protocol(tmp_path: Path) -> None:
     for resource in metadata:
         assert resource["uri"].startswith("resource://")
         assert not resource["uri"].startswith("file://")
+
+
+def test_resource_uris_are_encoded_and_cached(tmp_path: Path) -> None:
+    """Resource URIs should be percent-encoded and built only once."""
+    skill_dir = write_skill_with_resources(tmp_path, name="TestSkill")
+    (skill_dir / "docs").mkdir()
+    (skill_dir / "docs" / "read me.txt").write_text("hi", encoding="utf-8")
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    skill = registry.get("testskill")
+
+    assert (
+        "resource://skillz/testskill/docs/read%20me.txt"
+        in skill.resource_uris
+    )
+    assert skill.resource_uris is skill.resource_uris
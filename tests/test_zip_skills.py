@@ -1,6 +1,7 @@
 """Tests for zip-based skills support."""
 
 import base64
+import os
 from pathlib import Path
 import zipfile
 
@@ -529,3 +530,82 @@ def test_mixed_zip_and_skill_extensions(tmp_path: Path) -> None:
     assert skill_two.is_zip
     assert skill_one.zip_path == zip_path.resolve()
     assert skill_two.zip_path == skill_path.resolve()
+
+
+def test_zip_skill_reuses_archive_handle_until_changed(tmp_path: Path) -> None:
+    """Test that zip reads share one handle, reopened after changes."""
+    zip_path = tmp_path / "test-skill.zip"
+    create_zip_skill(zip_path, name="TestSkill")
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    skill = registry.get("testskill")
+    assert skill.open_bytes("text/hello.txt") == b"Hello from zip!"
+    handle = skill._zip_handle
+    assert handle is not None
+    assert skill.open_bytes("scripts/run.py") == b"print('hello')"
+    assert skill._zip_handle is handle
+
+    with zipfile.ZipFile(zip_path, "a") as z:
+        z.writestr("text/new.txt", "New file")
+    stat = zip_path.stat()
+    os.utime(zip_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert skill.open_bytes("text/new.txt") == b"New file"
+    assert skill._zip_handle is not handle
+
+    registry.close()
+    assert skill._zip_handle is None
+
+
+@pytest.mark.asyncio
+async def test_zip_skill_large_resources_are_streamed(tmp_path: Path) -> None:
+    """Test large zip members round-trip through the streaming path."""
+    from skillz._server import STREAM_THRESHOLD_BYTES
+
+    blob = bytes(range(256)) * (STREAM_THRESHOLD_BYTES // 256 + 7)
+    text = "line of text\n" * (STREAM_THRESHOLD_BYTES // 13 + 7)
+
+    zip_path = tmp_path / "test-skill.zip"
+    create_zip_skill(zip_path, name="TestSkill", with_resources=False)
+    with zipfile.ZipFile(zip_path, "a") as z:
+        z.writestr("bin/large.bin", blob)
+        z.writestr("text/large.txt", text)
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    server = build_server(registry)
+    tools = await server.get_tools()
+    fetch_tool = tools["fetch_resource"]
+
+    result = await fetch_tool.fn(
+        resource_uri="resource://skillz/testskill/bin/large.bin"
+    )
+    assert result["encoding"] == "base64"
+    assert base64.b64decode(result["content"]) == blob
+
+    result = await fetch_tool.fn(
+        resource_uri="resource://skillz/testskill/text/large.txt"
+    )
+    assert result["encoding"] == "utf-8"
+    assert result["content"] == text
+
+
+def test_zip_skill_cached_body_matches_reread(tmp_path: Path) -> None:
+    """Test the load-time body is normalized like a fresh read."""
+    zip_path = tmp_path / "indented.zip"
+    with zipfile.ZipFile(zip_path, "w") as z:
+        z.writestr(
+            "SKILL.md",
+            "---\nname: Indented\ndescription: Test\n---\n    Body here\n",
+        )
+
+    registry = SkillRegistry(tmp_path)
+    registry.load()
+
+    skill = registry.get("indented")
+    cached = skill.read_body()
+    skill.body = None
+    assert cached == skill.read_body() == "Body here\n"